@@ -4,11 +4,15 @@ from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_migrate import Migrate
 from config import Config
+from app.cache import UserCache
+from app.admission_control import AdmissionControl
 
 # Initialize extensions
 db = SQLAlchemy()
 jwt = JWTManager()
 migrate = Migrate()
+user_cache = UserCache()
+admission = AdmissionControl()
 
 def create_app(config_class=Config):
     app = Flask(__name__)
@@ -17,8 +21,15 @@ def create_app(config_class=Config):
     # Initialize Flask extensions
     db.init_app(app)
     jwt.init_app(app)
-    CORS(app)
+    CORS(app, expose_headers=['X-Total-Count', 'Link'])
     migrate.init_app(app, db)
+    user_cache.init_app(app)
+    admission.init_app(app)
+
+    # Resolve JWT identities through the user cache to expose current_user
+    @jwt.user_lookup_loader
+    def load_user(jwt_header, jwt_data):
+        return user_cache.get(jwt_data[app.config['JWT_IDENTITY_CLAIM']])
 
     # Import and initialize API
     from app.api_models import api
@@ -32,11 +43,13 @@ def create_app(config_class=Config):
     from app.routes.users import users_ns
     from app.routes.recipes import recipes_ns
     from app.routes.favorite_recipes import favorite_recipes_ns
+    from app.routes.metrics import metrics_ns
 
     api.add_namespace(auth_ns, path='/api')
     api.add_namespace(users_ns, path='/api')
     api.add_namespace(recipes_ns, path='/api')
     api.add_namespace(favorite_recipes_ns, path='/api')
+    api.add_namespace(metrics_ns, path='/api')
 
     # Register blueprints
     app.register_blueprint(api_bp)
@@ -0,0 +1,191 @@
+import threading
+import time
+from flask import g, request, jsonify
+
+
+class AdaptiveLimiter:
+    """Concurrency limit adjusted from latency relative to a baseline.
+
+    Each endpoint keeps a baseline of its own latency, so a naturally slow
+    endpoint does not look like overload. Once per window the average ratio
+    of observed to baseline latency is compared against the tolerance: above
+    it the limit is multiplied by the backoff, otherwise it grows by one if
+    concurrency reached the limit during the window.
+
+    Baselines follow lower window averages immediately and higher ones
+    gradually, but rise by at most `drift` per overloaded window, so
+    sustained overload is not absorbed into the baseline.
+    """
+
+    def __init__(self, initial, minimum, maximum, tolerance=2.0, window=1.0, backoff=0.9,
+                 smoothing=0.2, drift=0.01):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.tolerance = tolerance
+        self.window = window
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.drift = drift
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.latency_ratio = 1.0
+        self._peak_in_flight = 0
+        self._baselines = {}
+        self._window_latency = {}
+        self._ratio_sum = 0.0
+        self._ratio_count = 0
+        self._window_start = time.monotonic()
+        self._last_decrease = float('-inf')
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        with self._lock:
+            if self.in_flight >= int(self.limit):
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            self.admitted += 1
+            self._peak_in_flight = max(self._peak_in_flight, self.in_flight)
+            return True
+
+    def release(self, latency, endpoint=None):
+        """Record a finished request; return True if its window was overloaded"""
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight -= 1
+
+            # An endpoint's first sample becomes its baseline
+            baseline = self._baselines.setdefault(endpoint, latency)
+            self._ratio_sum += latency / baseline if baseline > 0 else 1.0
+            self._ratio_count += 1
+            total, count = self._window_latency.get(endpoint, (0.0, 0))
+            self._window_latency[endpoint] = (total + latency, count + 1)
+            if now - self._window_start < self.window:
+                return False
+
+            self.latency_ratio = self._ratio_sum / self._ratio_count
+            overloaded = self.latency_ratio > self.tolerance
+            self._update_baselines(overloaded)
+            self._ratio_sum = 0.0
+            self._ratio_count = 0
+            self._window_latency = {}
+            self._window_start = now
+            # Only grow a limit the window actually used, so quiet periods
+            # do not leave every budget at its maximum
+            saturated = self._peak_in_flight >= int(self.limit)
+            self._peak_in_flight = self.in_flight
+
+            if overloaded:
+                self._decrease(now)
+            elif saturated:
+                self.limit = min(self.maximum, self.limit + 1)
+            return overloaded
+
+    def _update_baselines(self, overloaded):
+        for endpoint, (total, count) in self._window_latency.items():
+            average = total / count
+            baseline = self._baselines[endpoint]
+            if average <= baseline:
+                self._baselines[endpoint] = average
+            elif overloaded:
+                self._baselines[endpoint] = min(average, baseline * (1 + self.drift))
+            else:
+                self._baselines[endpoint] = baseline + self.smoothing * (average - baseline)
+
+    def shrink(self):
+        """Back off in response to pressure reported by another budget"""
+        with self._lock:
+            self._decrease(time.monotonic())
+
+    def _decrease(self, now):
+        # At most one multiplicative decrease per window
+        if now - self._last_decrease >= self.window:
+            self.limit = max(self.minimum, self.limit * self.backoff)
+            self._last_decrease = now
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'admitted': self.admitted,
+                'rejected': self.rejected,
+                'latency_ratio': self.latency_ratio
+            }
+
+
+class AdmissionControl:
+    """Sheds load with a separate adaptive budget per endpoint class"""
+
+    SAFE_METHODS = ('GET', 'HEAD')
+
+    def __init__(self, app=None):
+        self.limiters = {}
+        self.pressure = {}
+        self.retry_after = 1
+        self.exempt = ()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.limiters = {
+            name: AdaptiveLimiter(
+                settings['initial'],
+                settings['min'],
+                settings['max'],
+                tolerance=app.config['ADMISSION_LATENCY_TOLERANCE'],
+                window=app.config['ADMISSION_WINDOW']
+            )
+            for name, settings in app.config['ADMISSION_LIMITS'].items()
+        }
+        self.pressure = app.config['ADMISSION_PRESSURE']
+        self.retry_after = app.config['ADMISSION_RETRY_AFTER']
+        self.exempt = tuple(app.config['ADMISSION_EXEMPT_ENDPOINTS'])
+
+        app.before_request(self._admit)
+        app.teardown_request(self._release)
+
+    def classify(self):
+        """Return the endpoint class of the current request, or None if exempt"""
+        if request.method == 'OPTIONS' or request.endpoint is None:
+            return None
+        if request.endpoint.startswith(self.exempt):
+            return None
+        if request.endpoint.startswith('api.auth_'):
+            return 'auth'
+        if request.method not in self.SAFE_METHODS:
+            return 'writes'
+        return 'reads'
+
+    def snapshot(self):
+        return {name: limiter.snapshot() for name, limiter in self.limiters.items()}
+
+    def _admit(self):
+        name = self.classify()
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            return None
+
+        if not limiter.try_acquire():
+            response = jsonify({"errors": ["Server is busy, please retry later"]})
+            response.status_code = 503
+            response.headers['Retry-After'] = str(self.retry_after)
+            return response
+
+        g.admission = (name, time.monotonic())
+        return None
+
+    def _release(self, exc):
+        admission = g.pop('admission', None)
+        if admission is None:
+            return
+
+        name, started = admission
+        overloaded = self.limiters[name].release(time.monotonic() - started, request.endpoint)
+        if overloaded:
+            # Shed the budgets competing with an overloaded class, e.g. logins
+            # slowing down reads
+            for other in self.pressure.get(name, ()):
+                self.limiters[other].shrink()
@@ -1,4 +1,4 @@
-from flask_restx import Api, fields
+from flask_restx import Api, fields, reqparse
 
 authorizations = {
     'Bearer Auth': {
@@ -17,6 +17,11 @@ api = Api(
     security='Bearer Auth'  # Set default security
 )
 
+# Pagination for list endpoints
+pagination_parser = reqparse.RequestParser()
+pagination_parser.add_argument('page', type=int, default=1, location='args', help='Page number, starting at 1')
+pagination_parser.add_argument('per_page', type=int, location='args', help='Items per page (capped at MAX_PAGE_SIZE)')
+
 # User models
 user_input = api.model('UserInput', {
     'username': fields.String(required=True, description='User username'),
@@ -73,6 +78,21 @@ recipe_output = api.model('Recipe', {
     'user': fields.String(description='Username who created the recipe')
 })
 
+# Metrics models
+limiter_state = api.model('LimiterState', {
+    'limit': fields.Integer(description='Current concurrency limit'),
+    'in_flight': fields.Integer(description='Requests currently being served'),
+    'admitted': fields.Integer(description='Requests admitted since startup'),
+    'rejected': fields.Integer(description='Requests shed with 503 since startup'),
+    'latency_ratio': fields.Float(description='Average latency over baseline in the last window')
+})
+
+admission_metrics = api.model('AdmissionMetrics', {
+    'auth': fields.Nested(limiter_state),
+    'writes': fields.Nested(limiter_state),
+    'reads': fields.Nested(limiter_state)
+})
+
 # Error models
 error_model = api.model('Error', {
     'errors': fields.List(fields.String, description='List of error messages')
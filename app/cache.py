@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class UserCache:
+    """Per-process cache of authenticated users keyed by JWT identity.
+
+    Cached users are detached from the session so they can be shared across
+    requests; only column attributes are safe to read from them. Entries are
+    kept in insertion order, which with a fixed TTL is also expiry order, so
+    expired and overflowing entries are evicted from the front on insert.
+    """
+
+    def __init__(self, app=None):
+        self.ttl = 300
+        self.max_size = 10000
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.ttl = app.config.get('USER_CACHE_TTL', self.ttl)
+        self.max_size = app.config.get('USER_CACHE_SIZE', self.max_size)
+        self.clear()
+
+    def get(self, identity):
+        """Return the user for an identity, loading it on a miss or expiry"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(identity)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        from app import db
+        from app.models import User
+
+        user = db.session.get(User, identity)
+        if user is None:
+            self.invalidate(identity)
+            return None
+
+        db.session.expunge(user)
+        with self._lock:
+            self._entries[identity] = (user, now + self.ttl)
+            self._entries.move_to_end(identity)
+            self._evict(now)
+        return user
+
+    def invalidate(self, identity):
+        with self._lock:
+            self._entries.pop(identity, None)
+
+    def _evict(self, now):
+        while self._entries:
+            oldest, (_, expires) = next(iter(self._entries.items()))
+            if expires > now and len(self._entries) <= self.max_size:
+                break
+            del self._entries[oldest]
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,51 @@
+from flask import current_app, request, url_for
+
+
+def page_args():
+    """Return the page and per_page query arguments of the current request.
+
+    Raises ValueError if either is not a positive integer. per_page defaults
+    to DEFAULT_PAGE_SIZE and is capped at MAX_PAGE_SIZE.
+    """
+    page = _positive_int('page', 1)
+    per_page = _positive_int('per_page', current_app.config['DEFAULT_PAGE_SIZE'])
+    return page, min(per_page, current_app.config['MAX_PAGE_SIZE'])
+
+
+def paginate(query):
+    """Return the requested page of a query and the headers describing it.
+
+    X-Total-Count carries the number of rows across all pages and Link the
+    first, prev, next and last page URLs.
+    """
+    page, per_page = page_args()
+    total = query.order_by(None).count()
+    items = query.limit(per_page).offset((page - 1) * per_page).all()
+
+    last = max((total + per_page - 1) // per_page, 1)
+    pages = {'first': 1}
+    if page > 1:
+        pages['prev'] = min(page - 1, last)
+    if page < last:
+        pages['next'] = page + 1
+    pages['last'] = last
+
+    links = [f'<{_page_url(number, per_page)}>; rel="{rel}"' for rel, number in pages.items()]
+    return items, {'X-Total-Count': str(total), 'Link': ', '.join(links)}
+
+
+def _page_url(page, per_page):
+    return url_for(request.endpoint, **(request.view_args or {}), page=page, per_page=per_page)
+
+
+def _positive_int(name, default):
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{name} must be a positive integer")
+    return number
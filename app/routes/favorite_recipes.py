@@ -1,9 +1,11 @@
 from flask import Blueprint
 from flask_restx import Resource, Namespace
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.orm import joinedload
+from flask_jwt_extended import jwt_required, current_user
 from app.models import FavoriteRecipe
 from app import db
-from app.api_models import api, recipe_input, recipe_output, error_model
+from app.api_models import api, recipe_input, recipe_output, error_model, pagination_parser
+from app.pagination import paginate
 
 favorite_recipes_ns = Namespace('favorite_recipes', description='Favorite recipe operations')
 api.add_namespace(favorite_recipes_ns)
@@ -12,12 +14,21 @@ api.add_namespace(favorite_recipes_ns)
 class FavoriteRecipeList(Resource):
     @jwt_required()
     @favorite_recipes_ns.doc(security='Bearer Auth')
+    @favorite_recipes_ns.expect(pagination_parser)
     @favorite_recipes_ns.response(200, 'Success', [recipe_output])
+    @favorite_recipes_ns.response(422, 'Validation error', error_model)
     def get(self):
-        """Get all favorite recipes for the current user"""
-        current_user_id = get_jwt_identity()
-        favorite_recipes = FavoriteRecipe.query.filter_by(user_id=current_user_id).all()
-        return [recipe.to_dict() for recipe in favorite_recipes], 200
+        """Get a page of favorite recipes for the current user"""
+        current_user_id = current_user.id
+        try:
+            favorite_recipes, headers = paginate(
+                FavoriteRecipe.query.options(joinedload(FavoriteRecipe.user))
+                .filter_by(user_id=current_user_id)
+                .order_by(FavoriteRecipe.id)
+            )
+        except ValueError as e:
+            return {"errors": [str(e)]}, 422
+        return [recipe.to_dict() for recipe in favorite_recipes], 200, headers
 
     @jwt_required()
     @favorite_recipes_ns.doc(security='Bearer Auth')
@@ -26,7 +37,7 @@ class FavoriteRecipeList(Resource):
     @favorite_recipes_ns.response(422, 'Validation error', error_model)
     def post(self):
         """Add a recipe to favorites"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         data = favorite_recipes_ns.payload
 
         try:
@@ -57,7 +68,7 @@ class FavoriteRecipeDetail(Resource):
     @favorite_recipes_ns.response(422, 'Validation error', error_model)
     def patch(self, id):
         """Update a favorite recipe"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         favorite_recipe = FavoriteRecipe.query.get_or_404(id)
 
         # Check if the current user owns the favorite recipe
@@ -88,7 +99,7 @@ class FavoriteRecipeDetail(Resource):
     @favorite_recipes_ns.response(404, 'Favorite recipe not found', error_model)
     def delete(self, id):
         """Remove a recipe from favorites"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         favorite_recipe = FavoriteRecipe.query.get_or_404(id)
 
         # Check if the current user owns the favorite recipe
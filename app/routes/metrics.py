@@ -0,0 +1,17 @@
+from flask import Blueprint
+from flask_restx import Resource, Namespace
+from app import admission
+from app.api_models import api, admission_metrics
+
+metrics_ns = Namespace('metrics', description='Runtime metrics')
+api.add_namespace(metrics_ns)
+
+@metrics_ns.route('/admission')
+class AdmissionMetrics(Resource):
+    @metrics_ns.response(200, 'Success', admission_metrics)
+    def get(self):
+        """Get admission control state for each endpoint class"""
+        return admission.snapshot(), 200
+
+# Register blueprint
+metrics_bp = Blueprint('metrics', __name__)
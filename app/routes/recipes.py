@@ -1,20 +1,27 @@
 from flask import Blueprint
 from flask_restx import Resource, Namespace
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy.orm import joinedload
+from flask_jwt_extended import jwt_required, current_user
 from app.models import Recipe
 from app import db
-from app.api_models import api, recipe_input, recipe_output, error_model
+from app.api_models import api, recipe_input, recipe_output, error_model, pagination_parser
+from app.pagination import paginate
 
 recipes_ns = Namespace('recipes', description='Recipe operations')
 api.add_namespace(recipes_ns)
 
 @recipes_ns.route('/recipes')
 class RecipeList(Resource):
+    @recipes_ns.expect(pagination_parser)
     @recipes_ns.response(200, 'Success', [recipe_output])
+    @recipes_ns.response(422, 'Validation error', error_model)
     def get(self):
-        """Get all recipes"""
-        recipes = Recipe.query.all()
-        return [recipe.to_dict() for recipe in recipes], 200
+        """Get a page of recipes"""
+        try:
+            recipes, headers = paginate(Recipe.query.options(joinedload(Recipe.user)).order_by(Recipe.id))
+        except ValueError as e:
+            return {"errors": [str(e)]}, 422
+        return [recipe.to_dict() for recipe in recipes], 200, headers
 
     @jwt_required()
     @recipes_ns.doc(security='Bearer Auth')
@@ -23,7 +30,7 @@ class RecipeList(Resource):
     @recipes_ns.response(422, 'Validation error', error_model)
     def post(self):
         """Create a new recipe"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         data = recipes_ns.payload
 
         try:
@@ -49,7 +56,7 @@ class RecipeDetail(Resource):
     @recipes_ns.response(404, 'Recipe not found', error_model)
     def get(self, id):
         """Get a specific recipe"""
-        recipe = Recipe.query.get_or_404(id)
+        recipe = Recipe.query.options(joinedload(Recipe.user)).get_or_404(id)
         return recipe.to_dict(), 200
 
     @jwt_required()
@@ -61,7 +68,7 @@ class RecipeDetail(Resource):
     @recipes_ns.response(422, 'Validation error', error_model)
     def patch(self, id):
         """Update a recipe"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         recipe = Recipe.query.get_or_404(id)
 
         # Check if the current user owns the recipe
@@ -92,7 +99,7 @@ class RecipeDetail(Resource):
     @recipes_ns.response(404, 'Recipe not found', error_model)
     def delete(self, id):
         """Delete a recipe"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         recipe = Recipe.query.get_or_404(id)
 
         # Check if the current user owns the recipe
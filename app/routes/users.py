@@ -1,20 +1,26 @@
 from flask import Blueprint
 from flask_restx import Resource, Namespace
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, current_user
 from app.models import User
-from app import db
-from app.api_models import api, user_output, error_model
+from app import db, user_cache
+from app.api_models import api, user_output, error_model, pagination_parser
+from app.pagination import paginate
 
 users_ns = Namespace('users', description='User operations')
 api.add_namespace(users_ns)
 
 @users_ns.route('/users')
 class UserList(Resource):
+    @users_ns.expect(pagination_parser)
     @users_ns.response(200, 'Success', [user_output])
+    @users_ns.response(422, 'Validation error', error_model)
     def get(self):
-        """Get all users"""
-        users = User.query.all()
-        return [user.to_dict() for user in users], 200
+        """Get a page of users"""
+        try:
+            users, headers = paginate(User.query.order_by(User.id))
+        except ValueError as e:
+            return {"errors": [str(e)]}, 422
+        return [user.to_dict() for user in users], 200, headers
 
 @users_ns.route('/me/<int:id>')
 class UserDetail(Resource):
@@ -24,6 +30,9 @@ class UserDetail(Resource):
     @users_ns.response(404, 'User not found', error_model)
     def get(self, id):
         """Get a specific user's details"""
+        if current_user.id == id:
+            return current_user.to_dict(), 200
+
         user = User.query.get_or_404(id)
         return user.to_dict(), 200
 
@@ -38,7 +47,7 @@ class UserUpdate(Resource):
     @users_ns.response(422, 'Validation error', error_model)
     def patch(self, id):
         """Update a user's information"""
-        current_user_id = get_jwt_identity()
+        current_user_id = current_user.id
         if current_user_id != id:
             return {"errors": ["Not authorized"]}, 401
 
@@ -55,6 +64,7 @@ class UserUpdate(Resource):
                 user.image_url = data['image_url']
 
             db.session.commit()
+            user_cache.invalidate(id)
             return user.to_dict(), 200
 
         except ValueError as e:
@@ -13,11 +13,36 @@ class Config:
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(hours=24)
     
+    # Seconds an authenticated user stays in the per-process cache
+    USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', 300))
+    # Most users the cache holds before evicting the oldest
+    USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', 10000))
+    
     # Application
     SECRET_KEY = os.getenv('JWT_SECRET_KEY')  # Using same key for Flask sessions
     
+    # Admission control: concurrency budgets per endpoint class. Limits back
+    # off once per window (seconds) while latency exceeds the tolerance times
+    # each endpoint's own baseline
+    ADMISSION_LIMITS = {
+        'auth': {'initial': 4, 'min': 1, 'max': 16},
+        'writes': {'initial': 16, 'min': 2, 'max': 64},
+        'reads': {'initial': 32, 'min': 4, 'max': 256}
+    }
+    ADMISSION_LATENCY_TOLERANCE = 2.0
+    ADMISSION_WINDOW = 1.0
+    # Budgets to shrink when a class is overloaded, so logins give way to reads
+    ADMISSION_PRESSURE = {'reads': ['auth']}
+    ADMISSION_RETRY_AFTER = 1
+    # Endpoint name prefixes never subject to admission control
+    ADMISSION_EXEMPT_ENDPOINTS = ['static', 'index', 'restx_doc.', 'api.specs', 'api.doc', 'api.root', 'api.metrics_']
+    
     # CORS
     CORS_HEADERS = 'Content-Type'
     
+    # Pagination for list endpoints
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+    
     # Categories for recipes
     VALID_CATEGORIES = ['Breakfast', 'Lunch', 'Supper', 'Drinks']
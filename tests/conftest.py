@@ -0,0 +1,219 @@
+import os
+import time
+from types import SimpleNamespace
+
+import bcrypt
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event, insert
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('JWT_SECRET_KEY', 'test-secret')
+
+from config import Config
+from app import create_app, db, user_cache
+from app.models import User, Recipe, FavoriteRecipe
+from helpers import BUDGETS, PASSWORD, recipe_row
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    JWT_SECRET_KEY = 'test-secret'
+
+
+# Modules whose time.monotonic the clock fixture replaces by default
+CLOCK_MODULES = ('app.cache', 'app.admission_control')
+
+
+class Clock:
+    """Manually advanced stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(request, monkeypatch):
+    """Freeze time in CLOCK_MODULES, or the modules given by indirect parametrization"""
+    clock = Clock()
+    for module in getattr(request, 'param', CLOCK_MODULES):
+        monkeypatch.setattr(f'{module}.time', SimpleNamespace(monotonic=clock))
+    return clock
+
+
+class QueryCounter:
+    """Records SQL statements executed on an engine while active"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+def seed(size):
+    """Recreate the schema with `size` recipes and favorites.
+
+    Recipes are spread across size // 10 users so per-row relationship loads
+    show up as extra queries; favorites all belong to user 1, the user the
+    harness authenticates as.
+    """
+    db.drop_all()
+    db.create_all()
+
+    password_hash = bcrypt.hashpw(PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    user_count = max(size // 10, 2)
+    db.session.execute(insert(User), [
+        {
+            'username': f'user{i}',
+            'email': f'user{i}@example.com',
+            'password_hash': password_hash,
+            'image_url': 'https://example.com/user.jpg'
+        }
+        for i in range(1, user_count + 1)
+    ])
+    db.session.execute(insert(Recipe), [
+        recipe_row(i, i % user_count + 1) for i in range(size)
+    ])
+    db.session.execute(insert(FavoriteRecipe), [
+        recipe_row(i, 1) for i in range(size)
+    ])
+    db.session.commit()
+    db.session.remove()
+
+
+@pytest.fixture(scope='session')
+def app():
+    return create_app(TestConfig)
+
+
+@pytest.fixture(scope='session')
+def database(app):
+    return Database(app)
+
+
+@pytest.fixture(scope='session')
+def harness(app, database):
+    return Harness(app, database)
+
+
+class Database:
+    """Tracks the size the shared in-memory database was seeded with.
+
+    create_app can only run once per process, so every test shares one app
+    and database; tests that modify rows call invalidate() so the next
+    seed() starts fresh.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.size = None
+
+    def seed(self, size):
+        if self.size != size:
+            with self.app.app_context():
+                seed(size)
+            self.size = size
+
+    def invalidate(self):
+        self.size = None
+
+
+class Harness:
+    """Seeds the database per data size and measures route cases.
+
+    Measurements are memoized per (case, size) so the budget tests and the
+    growth test share a single run of each case.
+    """
+
+    def __init__(self, app, database):
+        self.app = app
+        self.database = database
+        self.client = app.test_client()
+        self.samples = BUDGETS['samples']
+        self.results = {}
+        with app.app_context():
+            self.engine = db.engine
+            self.token = create_access_token(identity=1)
+
+    def measure(self, case, size):
+        key = (case.name, size)
+        if key not in self.results:
+            self.database.seed(size)
+            user_cache.clear()
+            # Warm-up request so one-off costs like the user cache miss are
+            # not attributed to the route
+            self.send(*self.build(case))
+
+            samples = BUDGETS['routes'][case.name].get('samples', self.samples)
+            counts, timings, rows = [], [], []
+            for _ in range(samples):
+                request = self.build(case)
+                with QueryCounter(self.engine) as counter:
+                    started = time.perf_counter()
+                    response = self.send(*request)
+                    timings.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == case.status, (
+                    f'{case.name} at {size} rows returned {response.status_code}: '
+                    f'{response.get_data(as_text=True)[:200]}'
+                )
+                counts.append(counter.count)
+                rows.append(returned_rows(response))
+            self.results[key] = Measurement(counts, timings, rows)
+        return self.results[key]
+
+    def build(self, case):
+        """Run the case's setup and return the request to send"""
+        with self.app.test_request_context():
+            kwargs = case.prepare() if case.prepare else {}
+            path = case.path(**kwargs)
+        body = case.body() if case.body else None
+        headers = {'Authorization': f'Bearer {self.token}'} if case.auth else {}
+        return case.method, path, body, headers
+
+    def send(self, method, path, body, headers):
+        return self.client.open(path, method=method, json=body, headers=headers)
+
+
+def returned_rows(response):
+    """Number of records in a response body: list length, 1 for an object"""
+    body = response.get_json(silent=True)
+    if isinstance(body, list):
+        return len(body)
+    return 1 if body else 0
+
+
+class Measurement:
+    def __init__(self, counts, timings, rows):
+        self.counts = counts
+        self.timings = timings
+        self.rows = rows
+
+    @property
+    def max_queries(self):
+        return max(self.counts)
+
+    @property
+    def max_rows(self):
+        return max(self.rows)
+
+    @property
+    def p95(self):
+        ordered = sorted(self.timings)
+        return ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
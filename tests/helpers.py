@@ -0,0 +1,26 @@
+import json
+import os
+
+BUDGETS_PATH = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+
+with open(BUDGETS_PATH) as f:
+    BUDGETS = json.load(f)
+
+# Every seeded user shares this password so login can be exercised
+PASSWORD = 'password'
+
+
+def recipe_row(index, user_id):
+    return {
+        'title': f'Recipe {index}',
+        'country': 'Kenya',
+        'rating': 4.5,
+        'ingredients': 'Flour, water, salt',
+        'procedure': 'Mix and bake',
+        'people_served': 4,
+        'category': 'Lunch',
+        'cooking_time': '30 minutes',
+        'image_url': 'https://example.com/recipe.jpg',
+        'video_link': 'https://example.com/recipe.mp4',
+        'user_id': user_id
+    }
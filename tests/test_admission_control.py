@@ -0,0 +1,183 @@
+import pytest
+from flask import Flask
+
+from config import Config
+from app.admission_control import AdaptiveLimiter, AdmissionControl
+
+
+def finish(limiter, clock, latency, endpoint='api.recipes_recipe_list'):
+    """Run one request through the limiter, advancing the clock by its latency"""
+    assert limiter.try_acquire()
+    clock.now += latency
+    return limiter.release(latency, endpoint)
+
+
+def saturate(limiter, clock, latency, endpoint='api.recipes_recipe_list'):
+    """Run as many concurrent requests as the limit allows, finishing together"""
+    running = int(limiter.limit)
+    for _ in range(running):
+        assert limiter.try_acquire()
+    clock.now += latency
+    return [limiter.release(latency, endpoint) for _ in range(running)]
+
+
+def test_limit_grows_by_one_per_saturated_window(clock):
+    limiter = AdaptiveLimiter(4, 1, 6, window=1.0)
+    saturate(limiter, clock, 0.01)
+    assert limiter.limit == 4
+
+    clock.now += 1.0
+    saturate(limiter, clock, 0.01)
+    assert limiter.limit == 5
+
+    for _ in range(5):
+        clock.now += 1.0
+        saturate(limiter, clock, 0.01)
+    assert limiter.limit == 6
+
+
+def test_limit_does_not_grow_when_unused(clock):
+    limiter = AdaptiveLimiter(4, 1, 6, window=1.0)
+    for _ in range(10):
+        clock.now += 1.0
+        finish(limiter, clock, 0.01)
+    assert limiter.limit == 4
+
+
+def test_limit_backs_off_once_per_overloaded_window(clock):
+    limiter = AdaptiveLimiter(20, 1, 20, window=1.0, backoff=0.5)
+    finish(limiter, clock, 0.01)
+
+    # A burst of slow concurrent requests halves the limit only once
+    for _ in range(20):
+        assert limiter.try_acquire()
+    clock.now += 1.0
+    overloaded = [limiter.release(0.1, 'api.recipes_recipe_list') for _ in range(20)]
+    assert any(overloaded)
+    assert limiter.limit == 10
+
+
+def test_sustained_overload_keeps_limit_reduced(clock):
+    limiter = AdaptiveLimiter(40, 4, 64, window=1.0, backoff=0.9)
+    for _ in range(3):
+        clock.now += 1.0
+        finish(limiter, clock, 0.01)
+
+    # Latency jumps to 5x its baseline and stays there
+    limits = []
+    for _ in range(12):
+        clock.now += 1.0
+        for _ in range(50):
+            finish(limiter, clock, 0.05)
+        limits.append(limiter.limit)
+        assert limiter.latency_ratio > limiter.tolerance
+    assert limits == sorted(limits, reverse=True)
+    assert limits[-1] < limits[0] < 40
+
+
+def test_limit_never_drops_below_minimum(clock):
+    limiter = AdaptiveLimiter(2, 2, 4, window=1.0, backoff=0.5)
+    finish(limiter, clock, 0.01)
+    for _ in range(3):
+        clock.now += 1.0
+        finish(limiter, clock, 1.0)
+    assert limiter.limit == 2
+
+
+def test_slow_endpoint_is_not_mistaken_for_overload(clock):
+    limiter = AdaptiveLimiter(4, 1, 8, window=1.0)
+    for _ in range(5):
+        clock.now += 1.0
+        saturate(limiter, clock, 4.0, endpoint='api.recipes_recipe_list')
+        saturate(limiter, clock, 0.01, endpoint='api.recipes_recipe_detail')
+    assert limiter.limit > 4
+
+
+def test_shrink_applies_once_per_window(clock):
+    limiter = AdaptiveLimiter(8, 1, 8, window=1.0, backoff=0.5)
+    limiter.shrink()
+    limiter.shrink()
+    assert limiter.limit == 4
+
+    clock.now += 1.0
+    limiter.shrink()
+    assert limiter.limit == 2
+
+
+@pytest.fixture
+def app(clock):
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.config['ADMISSION_LIMITS'] = {
+        'auth': {'initial': 4, 'min': 1, 'max': 4},
+        'writes': {'initial': 1, 'min': 1, 'max': 1},
+        'reads': {'initial': 1, 'min': 1, 'max': 4}
+    }
+    app.config['ADMISSION_RETRY_AFTER'] = 3
+
+    def read(latency='0'):
+        clock.now += float(latency)
+        return 'ok'
+
+    def fail():
+        raise RuntimeError('boom')
+
+    app.add_url_rule('/recipes', 'api.recipes_recipe_list', lambda: read())
+    app.add_url_rule('/recipes/<latency>', 'api.recipes_recipe_detail', read)
+    app.add_url_rule('/fail', 'api.recipes_fail', fail)
+    app.add_url_rule('/login', 'api.auth_login', lambda: 'ok', methods=['POST'])
+    app.add_url_rule('/swagger.json', 'api.specs', lambda: 'ok')
+    app.add_url_rule('/metrics/admission', 'api.metrics_admission_metrics', lambda: 'ok')
+    app.extensions['admission'] = AdmissionControl(app)
+    return app
+
+
+def test_requests_are_classified(app):
+    control = app.extensions['admission']
+    client = app.test_client()
+    client.get('/recipes')
+    client.post('/login')
+    client.delete('/recipes')
+    assert control.limiters['reads'].admitted == 1
+    assert control.limiters['auth'].admitted == 1
+    assert control.limiters['writes'].admitted == 0
+
+
+def test_exhausted_budget_returns_503_with_retry_after(app):
+    control = app.extensions['admission']
+    assert control.limiters['reads'].try_acquire()
+
+    response = app.test_client().get('/recipes')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '3'
+    assert response.get_json() == {"errors": ["Server is busy, please retry later"]}
+    assert control.limiters['reads'].rejected == 1
+
+
+def test_exempt_endpoints_bypass_limiter(app):
+    control = app.extensions['admission']
+    assert control.limiters['reads'].try_acquire()
+
+    client = app.test_client()
+    assert client.get('/swagger.json').status_code == 200
+    assert client.get('/metrics/admission').status_code == 200
+    assert client.options('/recipes').status_code == 200
+    assert control.limiters['reads'].rejected == 0
+
+
+def test_in_flight_released_when_route_raises(app):
+    control = app.extensions['admission']
+    response = app.test_client().get('/fail')
+    assert response.status_code == 500
+    assert control.limiters['reads'].in_flight == 0
+
+
+def test_read_overload_shrinks_auth_budget(app, clock):
+    control = app.extensions['admission']
+    client = app.test_client()
+    client.get('/recipes/0.01')
+
+    clock.now += 1.0
+    client.get('/recipes/0.5')
+    assert control.limiters['reads'].latency_ratio > 2
+    assert control.limiters['auth'].limit < 4
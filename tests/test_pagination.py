@@ -0,0 +1,52 @@
+import pytest
+
+
+@pytest.fixture
+def client(app, database):
+    database.seed(1000)
+    return app.test_client()
+
+
+def test_first_page_uses_default_page_size(app, client):
+    recipes = client.get('/recipes/recipes').get_json()
+    assert len(recipes) == app.config['DEFAULT_PAGE_SIZE']
+    assert recipes[0]['id'] == 1
+
+
+def test_page_and_per_page_select_rows(client):
+    recipes = client.get('/recipes/recipes?page=3&per_page=5').get_json()
+    assert [recipe['id'] for recipe in recipes] == [11, 12, 13, 14, 15]
+
+
+def test_per_page_is_capped(app, client):
+    recipes = client.get('/recipes/recipes?per_page=5000').get_json()
+    assert len(recipes) == app.config['MAX_PAGE_SIZE']
+
+
+def test_page_metadata_headers(client):
+    response = client.get('/recipes/recipes?page=3&per_page=100')
+    assert response.headers['X-Total-Count'] == '1000'
+    assert response.headers['Link'] == ', '.join([
+        '</recipes/recipes?page=1&per_page=100>; rel="first"',
+        '</recipes/recipes?page=2&per_page=100>; rel="prev"',
+        '</recipes/recipes?page=4&per_page=100>; rel="next"',
+        '</recipes/recipes?page=10&per_page=100>; rel="last"'
+    ])
+
+
+def test_last_page_has_no_next_link(client):
+    response = client.get('/recipes/recipes?page=10&per_page=100')
+    assert 'rel="next"' not in response.headers['Link']
+    assert '</recipes/recipes?page=9&per_page=100>; rel="prev"' in response.headers['Link']
+
+
+@pytest.mark.parametrize('query,error', [
+    ('page=abc', 'page must be a positive integer'),
+    ('page=-5', 'page must be a positive integer'),
+    ('per_page=0', 'per_page must be a positive integer'),
+])
+def test_invalid_page_arguments_are_rejected(client, query, error):
+    for path in ('/recipes/recipes', '/users/users'):
+        response = client.get(f'{path}?{query}')
+        assert response.status_code == 422
+        assert response.get_json() == {"errors": [error]}
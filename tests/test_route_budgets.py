@@ -0,0 +1,144 @@
+"""Query-count and latency budgets for every API route.
+
+Each case is measured against databases seeded at every size listed in
+query_budgets.json. A route fails when it runs more queries than its budget,
+when its query count changes with the data size (an N+1 pattern), when it
+returns more rows than its budget (an unbounded result set), or when its p95
+latency exceeds the budget for that size.
+"""
+import itertools
+
+import pytest
+from flask import url_for
+
+from app import db
+from app.models import Recipe, FavoriteRecipe
+from helpers import BUDGETS, PASSWORD, recipe_row
+
+SIZES = BUDGETS['sizes']
+
+# Endpoints served by Flask-RESTX itself rather than app/routes
+FRAMEWORK_ENDPOINTS = {'api.specs', 'api.doc', 'api.root'}
+
+_usernames = itertools.count()
+
+
+class Case:
+    def __init__(self, method, endpoint, status=200, auth=False, params=None, body=None, prepare=None):
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.auth = auth
+        self.params = params or {}
+        self.body = body
+        self.prepare = prepare
+
+    @property
+    def name(self):
+        return f'{self.method} {self.endpoint}'
+
+    def path(self, **kwargs):
+        return url_for(self.endpoint, **{**self.params, **kwargs})
+
+
+def signup_body():
+    username = f'signup{next(_usernames)}'
+    return {
+        'username': username,
+        'email': f'{username}@example.com',
+        'password': PASSWORD,
+        'password_confirmation': PASSWORD,
+        'image_url': 'https://example.com/user.jpg'
+    }
+
+
+def recipe_body():
+    body = recipe_row(0, 1)
+    del body['user_id']
+    return body
+
+
+def owned(model):
+    """Insert a row owned by user 1 and return its id as route params"""
+    def prepare():
+        row = model(**recipe_row(0, 1))
+        db.session.add(row)
+        db.session.commit()
+        return {'id': row.id}
+    return prepare
+
+
+CASES = [
+    Case('POST', 'api.auth_sign_up', status=201, body=signup_body),
+    Case('POST', 'api.auth_login', status=201, body=lambda: {'username': 'user1', 'password': PASSWORD}),
+    Case('GET', 'api.users_user_list'),
+    Case('GET', 'api.users_user_detail', auth=True, params={'id': 1}),
+    Case('PATCH', 'api.users_user_update', auth=True, params={'id': 1},
+         body=lambda: {'image_url': 'https://example.com/updated.jpg'}),
+    Case('GET', 'api.recipes_recipe_list'),
+    Case('POST', 'api.recipes_recipe_list', status=201, auth=True, body=recipe_body),
+    Case('GET', 'api.recipes_recipe_detail', params={'id': 1}),
+    Case('PATCH', 'api.recipes_recipe_detail', auth=True, body=recipe_body, prepare=owned(Recipe)),
+    Case('DELETE', 'api.recipes_recipe_detail', status=204, auth=True, prepare=owned(Recipe)),
+    Case('GET', 'api.favorite_recipes_favorite_recipe_list', auth=True),
+    Case('POST', 'api.favorite_recipes_favorite_recipe_list', status=201, auth=True, body=recipe_body),
+    Case('PATCH', 'api.favorite_recipes_favorite_recipe_detail', auth=True, body=recipe_body,
+         prepare=owned(FavoriteRecipe)),
+    Case('DELETE', 'api.favorite_recipes_favorite_recipe_detail', status=204, auth=True,
+         prepare=owned(FavoriteRecipe)),
+    Case('GET', 'api.metrics_admission_metrics'),
+]
+
+# Size-major so each database size is seeded once
+MEASUREMENTS = [(case, size) for size in SIZES for case in CASES]
+
+
+def budget(case):
+    return BUDGETS['routes'][case.name]
+
+
+def test_every_route_has_a_case(app):
+    covered = {case.name for case in CASES}
+    routes = {
+        f'{method} {rule.endpoint}'
+        for rule in app.url_map.iter_rules()
+        if rule.endpoint.startswith('api.')
+        and rule.endpoint not in FRAMEWORK_ENDPOINTS
+        # Namespaces are registered twice; the duplicate endpoints serve
+        # the same resources
+        and not rule.endpoint.endswith('_2')
+        for method in rule.methods - {'HEAD', 'OPTIONS'}
+    }
+    assert routes - covered == set()
+    assert covered - set(BUDGETS['routes']) == set()
+
+
+@pytest.mark.parametrize('case,size', MEASUREMENTS, ids=[f'{c.name}-{s}' for c, s in MEASUREMENTS])
+def test_query_budget(harness, case, size):
+    measurement = harness.measure(case, size)
+    assert measurement.max_queries <= budget(case)['max_queries'], (
+        f'{case.name} ran {measurement.max_queries} queries at {size} rows'
+    )
+
+
+@pytest.mark.parametrize('case,size', MEASUREMENTS, ids=[f'{c.name}-{s}' for c, s in MEASUREMENTS])
+def test_row_budget(harness, case, size):
+    measurement = harness.measure(case, size)
+    assert measurement.max_rows <= budget(case)['max_rows'], (
+        f'{case.name} returned {measurement.max_rows} rows at {size} rows'
+    )
+
+
+@pytest.mark.parametrize('case,size', MEASUREMENTS, ids=[f'{c.name}-{s}' for c, s in MEASUREMENTS])
+def test_latency_budget(harness, case, size):
+    measurement = harness.measure(case, size)
+    limit = budget(case)['p95_ms'][str(size)]
+    assert measurement.p95 <= limit, (
+        f'{case.name} p95 was {measurement.p95:.1f}ms at {size} rows (budget {limit}ms)'
+    )
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case.name for case in CASES])
+def test_query_count_does_not_grow_with_size(harness, case):
+    counts = {size: harness.measure(case, size).max_queries for size in SIZES}
+    assert len(set(counts.values())) == 1, f'{case.name} query counts by size: {counts}'
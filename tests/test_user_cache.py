@@ -0,0 +1,70 @@
+import pytest
+from flask_jwt_extended import create_access_token
+
+from app import db, user_cache
+from app.models import User
+
+
+@pytest.fixture
+def seeded(database):
+    database.seed(10)
+    user_cache.clear()
+    yield
+    user_cache.clear()
+    # These tests modify users
+    database.invalidate()
+
+
+def auth_headers(app, identity):
+    with app.app_context():
+        return {'Authorization': f'Bearer {create_access_token(identity=identity)}'}
+
+
+def set_image_url(app, identity, image_url):
+    with app.app_context():
+        db.session.get(User, identity).image_url = image_url
+        db.session.commit()
+
+
+def test_cached_user_expires_after_ttl(app, seeded, clock):
+    client = app.test_client()
+    headers = auth_headers(app, 2)
+    client.get('/users/me/2', headers=headers)
+
+    set_image_url(app, 2, 'https://example.com/changed.jpg')
+    assert client.get('/users/me/2', headers=headers).get_json()['image_url'] == 'https://example.com/user.jpg'
+
+    clock.now += user_cache.ttl
+    assert client.get('/users/me/2', headers=headers).get_json()['image_url'] == 'https://example.com/changed.jpg'
+
+
+def test_user_update_invalidates_cached_user(app, seeded, clock):
+    client = app.test_client()
+    headers = auth_headers(app, 2)
+    client.get('/users/me/2', headers=headers)
+
+    response = client.patch('/users/users/2', json={'image_url': 'https://example.com/new.jpg'}, headers=headers)
+    assert response.status_code == 200
+    assert client.get('/users/me/2', headers=headers).get_json()['image_url'] == 'https://example.com/new.jpg'
+
+
+def test_token_for_missing_user_is_rejected(app, seeded):
+    response = app.test_client().get('/users/me/9999', headers=auth_headers(app, 9999))
+    assert response.status_code == 401
+    assert len(user_cache) == 0
+
+
+def test_expired_entries_are_evicted_on_insert(app, seeded, clock):
+    with app.app_context():
+        user_cache.get(1)
+        clock.now += user_cache.ttl
+        user_cache.get(2)
+    assert len(user_cache) == 1
+
+
+def test_cache_size_is_capped(app, seeded, clock, monkeypatch):
+    monkeypatch.setattr(user_cache, 'max_size', 2)
+    with app.app_context():
+        for identity in (1, 2, 3):
+            user_cache.get(identity)
+    assert len(user_cache) == 2